@@ -16,6 +16,7 @@ import binascii
 import re
 from typing import TYPE_CHECKING, Final
 
+import numpy as np
 from bluetooth_data_tools import monotonic_time_coarse
 from homeassistant.components.bluetooth import (
     BaseHaRemoteScanner,
@@ -135,6 +136,10 @@ class BermudaDevice(dict):
         self.scanner_distance: dict[str, float] = {}
         self.scanner_distance_raw: dict[str, float] = {}
         self.scanner_last_update: dict[str, float] = {}
+        # The same distances / stamps for the floor-plan scanners, indexed by
+        # coordinator.scanner_index (NaN where absent), for the batched position solve.
+        self.scanner_distance_arr = np.full(len(self._coordinator.scanner_index), np.nan, dtype=np.float32)
+        self.scanner_last_update_arr = np.full(len(self._coordinator.scanner_index), np.nan, dtype=np.float64)
 
         self.zone: str = STATE_NOT_HOME  # STATE_HOME or STATE_NOT_HOME
         self.manufacturer: str | None = None
@@ -713,11 +718,15 @@ class BermudaDevice(dict):
         self.scanner_rssi.clear()
         self.scanner_distance.clear()
         self.scanner_distance_raw.clear()
+        self.scanner_distance_arr.fill(np.nan)
+        scanner_index = self._coordinator.scanner_index
         for advert in self.adverts.values():
             if advert.rssi is not None:
                 self.scanner_rssi[advert.scanner_address] = advert.rssi
             if advert.rssi_distance is not None:
                 self.scanner_distance[advert.scanner_address] = advert.rssi_distance
+                if (idx := scanner_index.get(advert.scanner_address)) is not None:
+                    self.scanner_distance_arr[idx] = advert.rssi_distance
             if hasattr(advert, "rssi_distance_raw") and advert.rssi_distance_raw is not None:
                 self.scanner_distance_raw[advert.scanner_address] = advert.rssi_distance_raw
 
@@ -744,9 +753,8 @@ class BermudaDevice(dict):
             self.coord_y = None
             self.position = None
 
-    def calculate_position(self, scanner_coords: dict[str, list[float] | tuple[float, float]] | None):
-        """Estimate x/y position based on scanner distances."""
-        pos = self.compute_position(scanner_coords)
+    def set_position(self, pos: tuple[float, float] | None):
+        """Record a trilaterated x/y position, or clear it if None."""
         if pos is None:
             self.coord_x = None
             self.coord_y = None
@@ -756,73 +764,6 @@ class BermudaDevice(dict):
         self.coord_x, self.coord_y = pos
         self.position = pos
 
-    def compute_position(
-        self,
-        scanner_coords: dict[str, list[float] | tuple[float, float]] | None,
-        max_age: float = 2.0,
-    ) -> tuple[float, float] | None:
-        """Return trilaterated position from per-scanner distances."""
-        if not scanner_coords:
-            return None
-
-        now = monotonic_time_coarse()
-        coords: list[tuple[float, float]] = []
-        dists: list[float] = []
-
-        for scanner, dist in self.scanner_distance.items():
-            if scanner not in scanner_coords:
-                continue
-            if (last := self.scanner_last_update.get(scanner)) is None:
-                continue
-            if now - last > max_age:
-                continue
-            xy = scanner_coords[scanner]
-            if not isinstance(xy, list | tuple) or len(xy) < 2:
-                continue
-            coords.append((float(xy[0]), float(xy[1])))
-            dists.append(float(dist))
-
-        if len(coords) < 3:
-            _LOGGER_SPAM_LESS.warning(
-                f"triangulation_insufficient_{self.address}",
-                "Triangulation requires at least 3 scanners, device %s position not determined.",
-                self.address,
-            )
-            return None
-
-        x1, y1 = coords[0]
-        d1 = dists[0]
-        rows = []
-        rhs = []
-        for (xi, yi), di in zip(coords[1:], dists[1:], strict=False):
-            rows.append((2 * (xi - x1), 2 * (yi - y1)))
-            rhs.append((d1**2 - di**2) + (xi**2 - x1**2) + (yi**2 - y1**2))
-
-        if len(rows) == 2:
-            a11, a12 = rows[0]
-            a21, a22 = rows[1]
-            b1, b2 = rhs
-            det = a11 * a22 - a12 * a21
-            if abs(det) < 1e-6:
-                return None
-            x = (b1 * a22 - b2 * a12) / det
-            y = (a11 * b2 - a21 * b1) / det
-            return (x, y)
-
-        sxx = sum(a[0] * a[0] for a in rows)
-        syy = sum(a[1] * a[1] for a in rows)
-        sxy = sum(a[0] * a[1] for a in rows)
-        sbx = sum(b * a[0] for a, b in zip(rows, rhs, strict=False))
-        sby = sum(b * a[1] for a, b in zip(rows, rhs, strict=False))
-
-        det = sxx * syy - sxy * sxy
-        if abs(det) < 1e-6:
-            return None
-
-        x = (sbx * syy - sby * sxy) / det
-        y = (sxx * sby - sbx * sxy) / det
-        return (x, y)
-
     def process_advertisement(self, scanner_device: BermudaDevice, advertisementdata: AdvertisementData):
         """
         Add/Update a scanner/advert entry pair on this device, indicating a received advertisement.
@@ -847,10 +788,9 @@ class BermudaDevice(dict):
             )
             return
 
-        if advert_tuple in self.adverts:
+        if (device_advert := self.adverts.get(advert_tuple)) is not None:
             # Device already exists, update it
-            self.adverts[advert_tuple].update_advertisement(advertisementdata, scanner_device)
-            device_advert = self.adverts[advert_tuple]
+            device_advert.update_advertisement(advertisementdata, scanner_device)
         else:
             # Create it
             device_advert = self.adverts[advert_tuple] = BermudaAdvert(
@@ -861,22 +801,28 @@ class BermudaDevice(dict):
             )
 
         # Let's see if we should update our last_seen based on this...
-        if device_advert.stamp is not None and self.last_seen < device_advert.stamp:
-            self.last_seen = device_advert.stamp
-
-        # Update per-scanner RSSI and distance immediately
-        if advertisementdata.rssi is not None:
-            offset = self.options.get(CONF_RSSI_OFFSETS, {}).get(scanner_address.upper(), 0)
-            ref_power = self.ref_power or self.options.get(CONF_REF_POWER)
-            attenuation = self.options.get(CONF_ATTENUATION)
-            raw_distance = rssi_to_metres(advertisementdata.rssi + offset, ref_power, attenuation)
-            alpha = 2 / (self.options.get(CONF_SMOOTHING_SAMPLES, DEFAULT_SMOOTHING_SAMPLES) + 1)
-            prev = self.scanner_distance.get(scanner_address)
+        if (advert_stamp := device_advert.stamp) is not None and self.last_seen < advert_stamp:
+            self.last_seen = advert_stamp
+
+        # Update per-scanner RSSI and distance immediately.
+        # This runs for every advert received, so lookups are bound to locals once.
+        if (rssi := advertisementdata.rssi) is not None:
+            options = self.options
+            scanner_distance = self.scanner_distance
+            offset = options.get(CONF_RSSI_OFFSETS, {}).get(scanner_address.upper(), 0)
+            raw_distance = rssi_to_metres(
+                rssi + offset, self.ref_power or options.get(CONF_REF_POWER), options.get(CONF_ATTENUATION)
+            )
+            alpha = 2 / (options.get(CONF_SMOOTHING_SAMPLES, DEFAULT_SMOOTHING_SAMPLES) + 1)
+            prev = scanner_distance.get(scanner_address)
             filtered = raw_distance if prev is None else alpha * raw_distance + (1 - alpha) * prev
-            self.scanner_distance[scanner_address] = filtered
+            scanner_distance[scanner_address] = filtered
             self.scanner_distance_raw[scanner_address] = raw_distance
-            self.scanner_rssi[scanner_address] = advertisementdata.rssi
-            self.scanner_last_update[scanner_address] = monotonic_time_coarse()
+            self.scanner_rssi[scanner_address] = rssi
+            self.scanner_last_update[scanner_address] = stamp = monotonic_time_coarse()
+            if (idx := self._coordinator.scanner_index.get(scanner_address)) is not None:
+                self.scanner_distance_arr[idx] = filtered
+                self.scanner_last_update_arr[idx] = stamp
 
     def process_manufacturer_data(self, advert: BermudaAdvert):
         """Parse manufacturer data for maker name and iBeacon etc."""
@@ -949,6 +895,10 @@ class BermudaDevice(dict):
                 # they are None (like self._hascanner), which will prevent them showing at all.
                 out[var] = val
                 continue
+            if isinstance(val, np.ndarray):
+                # Before the `in` tests below, which would compare element-wise.
+                out[var] = val.tolist()
+                continue
             if val in [self._coordinator, self.floor, self.area, self.ar, self.fr]:
                 # Objects to ignore completely.
                 continue
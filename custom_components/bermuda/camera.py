@@ -6,26 +6,149 @@ import io
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
+from bluetooth_data_tools import monotonic_time_coarse
 from homeassistant.components.camera import Camera
-from PIL import Image, ImageDraw
+from PIL import Image
+from PIL import __version__ as pillow_version
 
 from .const import (
+    _LOGGER,
     CONF_DEVICE_COORDS,
     CONF_ENABLE_TRIANGULATION,
     CONF_FLOORPLAN_IMAGE,
     CONF_SCANNER_COORDS,
     DEFAULT_ENABLE_TRIANGULATION,
 )
+from .util import coords_xy
 
 if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+
     from homeassistant.core import HomeAssistant
 
     from . import BermudaConfigEntry
     from .coordinator import BermudaDataUpdateCoordinator
 
+# Marker half-widths (in pixels) and RGBA colours for each kind of point.
+SCANNER_RADIUS, SCANNER_COLOUR = 4, (0, 0, 255, 192)
+DEVICE_RADIUS, DEVICE_COLOUR = 3, (255, 0, 0, 192)
+TRIANGULATED_RADIUS, TRIANGULATED_COLOUR = 2, (0, 255, 0, 192)
+
+
+def _make_sprite(
+    radius: int, colour: tuple[int, int, int, int], *, disc: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build a (2r+1)-pixel square marker, ready for alpha blending by _stamp.
+
+    Returns the colour premultiplied by its alpha, and the weight (255 - alpha)
+    to keep of the underlying pixels, both as uint16 so the blend can't
+    overflow. The colour's alpha channel is treated as fully opaque so that
+    blending also composites alpha "over" the floor plan. With disc=True only
+    the inscribed circle is painted, otherwise the whole square.
+    """
+    size = 2 * radius + 1
+    if disc:
+        dy, dx = np.ogrid[-radius : radius + 1, -radius : radius + 1]
+        mask = dx * dx + dy * dy <= radius * radius
+    else:
+        mask = np.ones((size, size), dtype=bool)
+    alpha = np.where(mask, colour[3], 0).astype(np.uint16)[..., np.newaxis]
+    premultiplied = np.array((*colour[:3], 255), dtype=np.uint16) * alpha
+    return premultiplied, 255 - alpha
+
+
+# Built once and blended in for every point, rather than rasterising each marker.
+SCANNER_SPRITE = _make_sprite(SCANNER_RADIUS, SCANNER_COLOUR, disc=True)
+DEVICE_SPRITE = _make_sprite(DEVICE_RADIUS, DEVICE_COLOUR)
+TRIANGULATED_SPRITE = _make_sprite(TRIANGULATED_RADIUS, TRIANGULATED_COLOUR)
+
+# Seconds between re-checking the floor plan file for existence / changes.
+PATH_CHECK_TTL = 1.0
+
+# How many requested sizes to keep a scaled floor plan and last frame for.
+FRAME_CACHE_SIZES = 4
+
+
+def _load_base(path: str) -> Image.Image:
+    """Decode the floor plan image into RGBA."""
+    with Image.open(path) as img:
+        return img.convert("RGBA")
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """Return path.stat(), or None if the file can't be reached."""
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def _coords_to_points(coords: Iterable) -> np.ndarray:
+    """Convert an iterable of [x, y] option values into an (N, 2) int32 pixel array, skipping malformed entries."""
+    points = np.array(
+        [point for xy in coords if (point := coords_xy(xy)) is not None],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    return np.rint(points).astype(np.int32)
+
+
+def _scale_points(points: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Map (N, 2) pixel points from the full size floor plan onto one scaled by (x, y) factors."""
+    if (scale == 1).all():
+        return points
+    return np.rint(points * scale).astype(np.int32)
+
+
+def _with_entry(cache: dict, key, value) -> dict:
+    """
+    Return a copy of cache with key set to value, dropping the oldest entries beyond FRAME_CACHE_SIZES.
+
+    The camera's caches are swapped for a new dict rather than changed in
+    place, so that executor jobs can read them while another job updates them.
+    """
+    items = [(k, v) for k, v in cache.items() if k != key]
+    items.append((key, value))
+    return dict(items[-FRAME_CACHE_SIZES:])
+
+
+def _stamp(arr: np.ndarray, points: np.ndarray, sprite: tuple[np.ndarray, np.ndarray]) -> None:
+    """
+    Alpha-blend a sprite from _make_sprite centred on each (integer) point of an (H, W, 4) array.
+
+    Points are clamped up front so every marker lies wholly inside the image
+    (anything off the edge is pinned to it). The painted pixels of all markers
+    are then gathered, blended and written back as one (N, P, 4) block, so the
+    cost is a handful of array operations however many points there are.
+    Every painted pixel of a sprite has the same colour and alpha, so where
+    markers overlap each write to a shared pixel carries the same value: the
+    overlap is painted once, whatever order the writes land in.
+    """
+    premultiplied, keep = sprite
+    radius = premultiplied.shape[0] // 2
+    height, width = arr.shape[:2]
+    if not len(points) or width <= 2 * radius or height <= 2 * radius:
+        return
+    corners = np.clip(points, radius, (width - radius - 1, height - radius - 1)) - radius
+    dy, dx = np.nonzero(keep[..., 0] < 255)
+    rows = corners[:, 1, np.newaxis] + dy
+    cols = corners[:, 0, np.newaxis] + dx
+    # dst * (255 - a) + src * a peaks at 255 * 255, so uint16 holds it; +127 rounds.
+    arr[rows, cols] = (arr[rows, cols] * keep[dy, dx] + premultiplied[dy, dx] + 127) // 255
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: BermudaConfigEntry, async_add_entities) -> None:
     """Set up camera platform."""
+    # Pillow-SIMD is a drop-in fork, versioned as x.y.z.postN
+    if ".post" in pillow_version:
+        _LOGGER.debug("Floor plan camera is using Pillow-SIMD %s", pillow_version)
+    else:
+        _LOGGER.debug(
+            "Floor plan camera is using stock Pillow %s, a Pillow-SIMD build will resize frames faster",
+            pillow_version,
+        )
     coordinator: BermudaDataUpdateCoordinator = entry.runtime_data.coordinator
     async_add_entities([BermudaFloorPlanCamera(coordinator, entry)])
 
@@ -43,41 +166,134 @@ class BermudaFloorPlanCamera(Camera):
         self._attr_unique_id = f"{entry.entry_id}_floorplan"
         # Ensure HA knows we return PNG data
         self.content_type = "image/png"
+        # Per requested (width, height): the (path, mtime, size) of the image file,
+        # the floor plan scaled to fit with the scanners drawn on (as an RGBA array),
+        # the (x, y) factors from full size pixels to it, and the scaled pinned
+        # devices. Frames of different sizes can render at once, so each entry is
+        # only ever published whole.
+        self._static_layers: dict[tuple, tuple[tuple, np.ndarray, np.ndarray, np.ndarray]] = {}
+        # (path, mtime, size) of the image file and its RGBA decode, which new sizes
+        # are scaled from. Replaced whole when the file changes, so that a stale
+        # decode isn't kept around. Shared, so copy() before drawing.
+        self._base: tuple[tuple, Image.Image] | None = None
+        # Per requested (width, height): inputs of the last frame and the PNG they produced.
+        self._last_frames: dict[tuple, tuple[tuple, bytes]] = {}
+        # Last (path, stamp, stat) of the floor plan file, None for a missing file.
+        self._path_check: tuple[Path, float, os.stat_result | None] | None = None
+        # Any change to the options reloads the entry (and so this entity), so the
+        # configured coordinates only need parsing once.
+        self._scanner_pts = _coords_to_points(entry.options.get(CONF_SCANNER_COORDS, {}).values())
+        self._device_pts = _coords_to_points(entry.options.get(CONF_DEVICE_COORDS, {}).values())
+
+    def _render_static_layer(
+        self, cached: Image.Image, width: int | None, height: int | None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Shrink the decoded floor plan to fit width x height and draw the scanner markers onto it.
+
+        Like any thumbnail the aspect ratio is kept and the image is never
+        enlarged. Scaling here, before any markers go on, means the PNG encode
+        only has the requested pixels to deal with while the markers keep
+        their full size. Returns the layer, the (x, y) scale factors and the
+        pinned device points scaled to match.
+        """
+        if width or height:
+            img = cached.copy()
+            img.thumbnail((width or cached.width, height or cached.height), Image.Resampling.BILINEAR)
+        else:
+            img = cached
+        scale = np.array((img.width / cached.width, img.height / cached.height))
+        layer = np.array(img)
+        _stamp(layer, _scale_points(self._scanner_pts, scale), SCANNER_SPRITE)
+        return layer, scale, _scale_points(self._device_pts, scale)
+
+    async def _async_stat(self, path: Path) -> os.stat_result | None:
+        """stat() the floor plan in the executor, reusing the result for PATH_CHECK_TTL seconds."""
+        nowstamp = monotonic_time_coarse()
+        if self._path_check is not None:
+            checked_path, stamp, stat = self._path_check
+            if checked_path == path and nowstamp - stamp < PATH_CHECK_TTL:
+                return stat
+        stat = await self.coordinator.hass.async_add_executor_job(_stat_or_none, path)
+        self._path_check = (path, nowstamp, stat)
+        return stat
 
     async def async_camera_image(self, width: int | None = None, height: int | None = None) -> bytes | None:
         """Return camera image."""
-        image_path = self.entry.options.get(CONF_FLOORPLAN_IMAGE)
+        options = self.entry.options
+        image_path = options.get(CONF_FLOORPLAN_IMAGE)
         if not image_path:
             return None
         path = Path(image_path)
         if not path.is_absolute():
             path = Path(self.coordinator.hass.config.path(image_path))
-        if not path.exists():
+        if (stat := await self._async_stat(path)) is None:
             return None
-        data = await self.coordinator.hass.async_add_executor_job(path.read_bytes)
-        base = Image.open(io.BytesIO(data)).convert("RGBA")
-        draw = ImageDraw.Draw(base)
-        scanner_coords = self.entry.options.get(CONF_SCANNER_COORDS, {})
-        for coords in scanner_coords.values():
-            if isinstance(coords, list | tuple) and len(coords) >= 2:
-                x, y = float(coords[0]), float(coords[1])
-                draw.ellipse((x - 4, y - 4, x + 4, y + 4), fill=(0, 0, 255, 192))
-        device_coords = self.entry.options.get(CONF_DEVICE_COORDS, {})
-        for coords in device_coords.values():
-            if isinstance(coords, list | tuple) and len(coords) >= 2:
-                x, y = float(coords[0]), float(coords[1])
-                draw.rectangle((x - 3, y - 3, x + 3, y + 3), fill=(255, 0, 0, 192))
-        if self.entry.options.get(CONF_ENABLE_TRIANGULATION, DEFAULT_ENABLE_TRIANGULATION):
-            for device in self.coordinator.devices.values():
-                if device.coord_x is not None and device.coord_y is not None:
-                    x, y = device.coord_x, device.coord_y
-                    draw.rectangle((x - 2, y - 2, x + 2, y + 2), fill=(0, 255, 0, 192))
-        if width is not None or height is not None:
-            if width is None:
-                width = round(base.width * (height / base.height))
-            if height is None:
-                height = round(base.height * (width / base.width))
-            base = base.resize((width, height))
-        out = io.BytesIO()
-        base.save(out, format="PNG")
-        return out.getvalue()
+        # Device positions are read here rather than in the executor, since the
+        # coordinator replaces them from the event loop.
+        if options.get(CONF_ENABLE_TRIANGULATION, DEFAULT_ENABLE_TRIANGULATION):
+            tri_xy = self.coordinator.tri_xy
+            triangulated = np.rint(tri_xy[~np.isnan(tri_xy[:, 0])]).astype(np.int32)
+        else:
+            triangulated = np.empty((0, 2), dtype=np.int32)
+
+        # If nothing that feeds the picture has changed, the last PNG at this size is still right.
+        sig = (
+            str(path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            triangulated.tobytes(),
+        )
+        if (last := self._last_frames.get((width, height))) is not None and last[0] == sig:
+            return last[1]
+
+        png = await self.coordinator.hass.async_add_executor_job(
+            self._render_blocking,
+            path,
+            stat,
+            triangulated,
+            width,
+            height,
+        )
+        self._last_frames = _with_entry(self._last_frames, (width, height), (sig, png))
+        return png
+
+    def _render_blocking(
+        self,
+        path: Path,
+        stat: os.stat_result,
+        triangulated: np.ndarray,
+        width: int | None,
+        height: int | None,
+    ) -> bytes:
+        """
+        Draw and encode a frame.
+
+        All of the decoding, drawing and PNG encoding happens in here so
+        that it can run as a single executor job, off the event loop.
+        """
+        file_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        static = self._static_layers.get((width, height))
+        if static is None or static[0] != file_key:
+            if (base := self._base) is None or base[0] != file_key:
+                base = self._base = (file_key, _load_base(file_key[0]))
+            static = (file_key, *self._render_static_layer(base[1], width, height))
+            # Layers made from an older version of the file are dropped along the way.
+            self._static_layers = _with_entry(
+                {size: layer for size, layer in self._static_layers.items() if layer[0] == file_key},
+                (width, height),
+                static,
+            )
+        _, layer, scale, device_pts = static
+        frame = layer.copy()
+        _stamp(frame, device_pts, DEVICE_SPRITE)
+        _stamp(frame, _scale_points(triangulated, scale), TRIANGULATED_SPRITE)
+        # frombuffer wraps the array's memory rather than copying it like fromarray would.
+        base = Image.frombuffer("RGBA", (frame.shape[1], frame.shape[0]), frame, "raw", "RGBA", 0, 1)
+        with io.BytesIO() as out:
+            # zlib level 1 is several times quicker than PIL's default of 6 and
+            # only costs a little size on flat-coloured floor plans.
+            base.save(out, format="PNG", compress_level=1)
+            # With no getbuffer() views held, getvalue() hands over the
+            # BytesIO's own buffer instead of copying it.
+            return out.getvalue()
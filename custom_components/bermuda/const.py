@@ -69,6 +69,8 @@ DISTANCE_TIMEOUT = 30  # seconds to wait before marking a sensor distance measur
 # as unknown/none/stale/away. Separate from device_tracker.
 DISTANCE_INFINITE = 999  # arbitrary distance for infinite/unknown rssi range
 
+TRIANGULATION_MAX_AGE = 2.0  # seconds, scanner distances older than this are left out of position solves
+
 AREA_MAX_AD_AGE: Final = max(DISTANCE_TIMEOUT / 3, UPDATE_INTERVAL * 2)
 # Adverts older than this can not win an area contest.
 
@@ -6,9 +6,11 @@ import re
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from math import isnan
 from typing import TYPE_CHECKING, cast
 
 import aiofiles
+import numpy as np
 import voluptuous as vol
 import yaml
 from bluetooth_data_tools import monotonic_time_coarse
@@ -95,9 +97,10 @@ from .const import (
     SAVEOUT_COOLDOWN,
     SIGNAL_DEVICE_NEW,
     SIGNAL_SCANNERS_CHANGED,
+    TRIANGULATION_MAX_AGE,
     UPDATE_INTERVAL,
 )
-from .util import mac_explode_formats, mac_norm
+from .util import coords_xy, mac_explode_formats, mac_norm, trilaterate_batch
 
 if TYPE_CHECKING:
     from habluetooth import BluetoothServiceInfoBleak
@@ -268,10 +271,20 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
                     CONF_SMOOTHING_SAMPLES,
                     CONF_RSSI_OFFSETS,
                     CONF_ENABLE_TRIANGULATION,
+                    CONF_SCANNER_COORDS,
                 ):
                     self.options[key] = val
 
         self.devices: dict[str, BermudaDevice] = {}
+        # Triangulated x/y of each device as one (N, 2) array (NaN where there's no fix),
+        # so the floor plan can draw them without walking self.devices.
+        self._tri_xy: np.ndarray = np.empty((0, 2), dtype=np.float32)
+        # Position of each floor-plan scanner within the per-device distance arrays,
+        # and the matching (S, 2) scanner coordinates. Changing options reloads
+        # the entry, so these are only built here.
+        self._scanner_index: dict[str, int] = {}
+        self._scanner_points: np.ndarray = np.empty((0, 2))
+        self._load_scanner_coords()
         # self.updaters: dict[str, BermudaPBDUCoordinator] = {}
 
         # Register the dump_devices service
@@ -304,6 +317,16 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
     def scanner_list(self):
         return self._scanner_list
 
+    @property
+    def scanner_index(self) -> dict[str, int]:
+        """Map of scanner address to its slot in each device's scanner_*_arr arrays."""
+        return self._scanner_index
+
+    @property
+    def tri_xy(self) -> np.ndarray:
+        """Triangulated device positions as an (N, 2) float32 array, NaN rows for no fix."""
+        return self._tri_xy
+
     @property
     def get_scanners(self) -> set[BermudaDevice]:
         return self._scanners
@@ -671,8 +694,10 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
             for device in self.devices.values():
                 # Recalculate smoothed distances, last_seen etc
                 device.calculate_data()
-                if self.options.get(CONF_ENABLE_TRIANGULATION, DEFAULT_ENABLE_TRIANGULATION):
-                    device.calculate_position(self.options.get(CONF_SCANNER_COORDS, {}))
+            if self.options.get(CONF_ENABLE_TRIANGULATION, DEFAULT_ENABLE_TRIANGULATION):
+                self._calculate_positions()
+            else:
+                self._tri_xy = np.full((len(self.devices), 2), np.nan, dtype=np.float32)
 
             self._refresh_areas_by_min_distance()
 
@@ -725,6 +750,57 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator):
         self.last_update_success = True
         return result_gather_adverts
 
+    def _load_scanner_coords(self):
+        """Build the scanner index and (S, 2) scanner points from the scanner coordinates option."""
+        scanner_index: dict[str, int] = {}
+        scanner_xy = []
+        for address, xy in self.options.get(CONF_SCANNER_COORDS, {}).items():
+            if (point := coords_xy(xy)) is None:
+                _LOGGER_SPAM_LESS.warning(
+                    f"bad_scanner_coords_{address}",
+                    "Ignoring scanner %s floor plan coordinates %r, expected [x, y] numbers.",
+                    address,
+                    xy,
+                )
+                continue
+            scanner_index[address] = len(scanner_xy)
+            scanner_xy.append(point)
+        self._scanner_index = scanner_index
+        self._scanner_points = np.array(scanner_xy, dtype=np.float64).reshape(-1, 2)
+
+    def _calculate_positions(self):
+        """
+        Trilaterate all devices in one batched solve.
+
+        Stacks each device's per-scanner distance array into a devices x scanners
+        matrix, blanks out stale readings, solves it with trilaterate_batch and
+        writes the results back to each device and to self._tri_xy.
+        """
+        devices = list(self.devices.values())
+        scanner_count = len(self._scanner_index)
+        dists = np.array([device.scanner_distance_arr for device in devices], dtype=np.float64)
+        stamps = np.array([device.scanner_last_update_arr for device in devices], dtype=np.float64)
+        dists = dists.reshape(len(devices), scanner_count)
+        stamps = stamps.reshape(len(devices), scanner_count)
+        # Written as "not fresh" so that a NaN (never updated) stamp counts as stale.
+        dists[~(monotonic_time_coarse() - stamps <= TRIANGULATION_MAX_AGE)] = np.nan
+
+        if scanner_count:
+            for i in np.flatnonzero(np.count_nonzero(~np.isnan(dists), axis=1) < 3).tolist():
+                if not devices[i].create_sensor:
+                    # Most BLE devices in range aren't tracked, don't warn about every one of them.
+                    continue
+                _LOGGER_SPAM_LESS.warning(
+                    f"triangulation_insufficient_{devices[i].address}",
+                    "Triangulation requires at least 3 scanners, device %s position not determined.",
+                    devices[i].address,
+                )
+
+        positions = trilaterate_batch(self._scanner_points, dists)
+        for device, (x, y) in zip(devices, positions.tolist(), strict=True):
+            device.set_position(None if isnan(x) else (x, y))
+        self._tri_xy = positions.astype(np.float32)
+
     def _async_gather_advert_data(self):
         """Perform the gathering of backend Bluetooth Data and updating scanners and devices."""
         nowstamp = monotonic_time_coarse()
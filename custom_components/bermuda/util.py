@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from math import isfinite
+
+import numpy as np
 
 
 @lru_cache(64)
@@ -108,6 +111,64 @@ def rssi_to_metres(rssi, ref_power=None, attenuation=None):
     return 10 ** ((ref_power - rssi) / (10 * attenuation))
 
 
+def coords_xy(xy) -> tuple[float, float] | None:
+    """Return an [x, y] coordinate option value as a pair of floats, or None if it isn't a usable one."""
+    if not isinstance(xy, list | tuple) or len(xy) < 2:
+        return None
+    try:
+        x, y = float(xy[0]), float(xy[1])
+    except (TypeError, ValueError):
+        return None
+    if not (isfinite(x) and isfinite(y)):
+        return None
+    return (x, y)
+
+
+def trilaterate_batch(points: np.ndarray, dists: np.ndarray) -> np.ndarray:
+    """
+    Trilaterate many devices against the same set of scanners at once.
+
+    points is the (S, 2) array of scanner x/y, dists an (N, S) array of each
+    device's distance to each scanner, NaN where there is no usable reading.
+
+    The circle equations of each device are linearised by subtracting the one
+    for its first available scanner, and the 2x2 normal equations of the
+    least-squares fit for all devices are built and solved as whole-array
+    operations. Returns an (N, 2) array of x/y, with NaN rows for devices that
+    can't be placed (fewer than three readings, or near-collinear scanners).
+    """
+    out = np.full((dists.shape[0], 2), np.nan)
+    valid = ~np.isnan(dists)
+    counts = valid.sum(axis=1)
+    rows = np.flatnonzero(counts >= 3)
+    if rows.size == 0:
+        return out
+
+    valid = valid[rows]
+    dists = np.where(valid, dists[rows], 0.0)
+    idx = np.arange(rows.size)
+    ref = valid.argmax(axis=1)  # first usable scanner of each device
+    ref_xy = points[ref]
+    k = dists[idx, ref] ** 2 - (ref_xy**2).sum(axis=1)
+
+    # Rows of the linearised system, zeroed where a scanner isn't used.
+    weight = valid.copy()
+    weight[idx, ref] = False
+    a = 2 * (points[np.newaxis, :, :] - ref_xy[:, np.newaxis, :]) * weight[..., np.newaxis]
+    b = (k[:, np.newaxis] - dists**2 + (points**2).sum(axis=1)) * weight
+
+    m = np.einsum("nsi,nsj->nij", a, a)
+    r = np.einsum("nsi,ns->ni", a, b)
+    det = m[:, 0, 0] * m[:, 1, 1] - m[:, 0, 1] * m[:, 1, 0]
+    # With three scanners A is square, and det(A^T A) == det(A)^2.
+    solvable = np.abs(det) >= np.where(counts[rows] == 3, 1e-12, 1e-6)
+    det = np.where(solvable, det, 1.0)
+    x = (r[:, 0] * m[:, 1, 1] - r[:, 1] * m[:, 0, 1]) / det
+    y = (m[:, 0, 0] * r[:, 1] - r[:, 0] * m[:, 1, 0]) / det
+    out[rows[solvable]] = np.column_stack((x, y))[solvable]
+    return out
+
+
 @lru_cache(256)
 def clean_charbuf(instring: str | None) -> str:
     """
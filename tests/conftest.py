@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import copy
+from unittest.mock import MagicMock, patch
 from homeassistant.config_entries import ConfigEntryState
 
 import pytest
@@ -14,10 +15,10 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.bermuda.const import DOMAIN
 from custom_components.bermuda.const import NAME
 
-# from .const import MOCK_OPTIONS
-from .const import MOCK_CONFIG
+from custom_components.bermuda.coordinator import BermudaDataUpdateCoordinator
 
-# from custom_components.bermuda import BermudaDataUpdateCoordinator
+# from .const import MOCK_OPTIONS
+from .const import MOCK_CONFIG, MOCK_OPTIONS_GLOBALS
 
 
 pytest_plugins = "pytest_homeassistant_custom_component"
@@ -111,3 +112,21 @@ async def setup_bermuda_entry(hass: HomeAssistant):
     await async_setup_component(hass, DOMAIN, {})
     assert config_entry.state == ConfigEntryState.LOADED
     return config_entry
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Fixture for mocking BermudaDataUpdateCoordinator."""
+    coordinator = MagicMock()
+    # deepcopy so tests that set nested options (like scanner coords) can't leak into each other.
+    coordinator.options = copy.deepcopy(MOCK_OPTIONS_GLOBALS)
+    coordinator.hass_version_min_2025_4 = True
+    coordinator.devices = {}
+    # The real properties and option parsing, so that the floor plan scanner state
+    # is wired up just as the coordinator does it. Call load_scanner_coords() again
+    # after changing the scanner coordinates option.
+    type(coordinator).scanner_index = BermudaDataUpdateCoordinator.scanner_index
+    type(coordinator).tri_xy = BermudaDataUpdateCoordinator.tri_xy
+    coordinator.load_scanner_coords = lambda: BermudaDataUpdateCoordinator._load_scanner_coords(coordinator)
+    coordinator.load_scanner_coords()
+    return coordinator
@@ -2,27 +2,16 @@
 Tests for BermudaDevice class in bermuda_device.py.
 """
 
-import logging
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 from homeassistant.components.bluetooth import BaseHaScanner, BaseHaRemoteScanner
 from custom_components.bermuda.bermuda_device import BermudaDevice
-from bluetooth_data_tools import monotonic_time_coarse
 from custom_components.bermuda.const import (
     CONF_SCANNER_COORDS,
     ICON_DEFAULT_AREA,
     ICON_DEFAULT_FLOOR,
 )
-from .const import MOCK_OPTIONS_GLOBALS
-
-
-@pytest.fixture
-def mock_coordinator():
-    """Fixture for mocking BermudaDataUpdateCoordinator."""
-    coordinator = MagicMock()
-    coordinator.options = MOCK_OPTIONS_GLOBALS.copy()
-    coordinator.hass_version_min_2025_4 = True
-    return coordinator
 
 
 @pytest.fixture
@@ -124,6 +113,24 @@ def test_process_advertisement(bermuda_device, bermuda_scanner):
     assert bermuda_scanner.address in bermuda_device.scanner_last_update
 
 
+def test_process_advertisement_scanner_arrays(mock_coordinator, bermuda_scanner):
+    """Floor plan scanners also get their distance and stamp recorded in the array slots."""
+    mock_coordinator.options[CONF_SCANNER_COORDS] = {"00:00:00:00:00:01": [0, 0], bermuda_scanner.address: [1, 1]}
+    mock_coordinator.load_scanner_coords()
+    device = BermudaDevice(address="AA:BB:CC:DD:EE:01", coordinator=mock_coordinator)
+    advertisement_data = MagicMock()
+    advertisement_data.rssi = -70
+    advertisement_data.tx_power = -20
+    advertisement_data.local_name = "test"
+    advertisement_data.manufacturer_data = {}
+    advertisement_data.service_data = {}
+    advertisement_data.service_uuids = []
+    device.process_advertisement(bermuda_scanner, advertisement_data)
+    assert np.isnan(device.scanner_distance_arr[0])
+    assert device.scanner_distance_arr[1] == pytest.approx(device.scanner_distance[bermuda_scanner.address])
+    assert device.scanner_last_update_arr[1] == device.scanner_last_update[bermuda_scanner.address]
+
+
 # def test_process_manufacturer_data(bermuda_device):
 #     """Test process_manufacturer_data method."""
 #     mock_advert = MagicMock()
@@ -147,73 +154,3 @@ def test_repr(bermuda_device):
     """Test __repr__ method."""
     repr_str = repr(bermuda_device)
     assert repr_str == f"{bermuda_device.name} [{bermuda_device.address}]"
-
-
-def test_compute_position(bermuda_device):
-    """Test compute_position with three scanners."""
-    bermuda_device.options[CONF_SCANNER_COORDS] = {
-        "s1": [0.0, 0.0],
-        "s2": [2.0, 0.0],
-        "s3": [0.0, 2.0],
-    }
-    now = monotonic_time_coarse()
-    d = 2**0.5
-    bermuda_device.scanner_distance = {"s1": d, "s2": d, "s3": d}
-    bermuda_device.scanner_last_update = {"s1": now, "s2": now, "s3": now}
-
-    pos = bermuda_device.compute_position(bermuda_device.options[CONF_SCANNER_COORDS])
-    assert pos is not None
-    x, y = pos
-    assert pytest.approx(x, rel=1e-3) == 1.0
-    assert pytest.approx(y, rel=1e-3) == 1.0
-
-
-def test_compute_position_insufficient_scanners_warns(bermuda_device, caplog):
-    """Test warning when fewer than three scanners are available."""
-    bermuda_device.options[CONF_SCANNER_COORDS] = {
-        "s1": [0.0, 0.0],
-        "s2": [2.0, 0.0],
-    }
-    now = monotonic_time_coarse()
-    bermuda_device.scanner_distance = {"s1": 1.0, "s2": 1.0}
-    bermuda_device.scanner_last_update = {"s1": now, "s2": now}
-
-    with caplog.at_level(logging.WARNING):
-        pos = bermuda_device.compute_position(bermuda_device.options[CONF_SCANNER_COORDS])
-    assert pos is None
-    assert any("Triangulation requires at least 3 scanners" in r.message for r in caplog.records)
-
-
-def test_compute_position_many_scanners(bermuda_device):
-    """Test compute_position with more than three scanners."""
-    bermuda_device.options[CONF_SCANNER_COORDS] = {
-        "s1": [0.0, 0.0],
-        "s2": [2.0, 0.0],
-        "s3": [0.0, 2.0],
-        "s4": [2.0, 2.0],
-    }
-    now = monotonic_time_coarse()
-    d = 2**0.5
-    bermuda_device.scanner_distance = {"s1": d, "s2": d, "s3": d, "s4": d}
-    bermuda_device.scanner_last_update = {"s1": now, "s2": now, "s3": now, "s4": now}
-
-    pos = bermuda_device.compute_position(bermuda_device.options[CONF_SCANNER_COORDS])
-    assert pos is not None
-    x, y = pos
-    assert pytest.approx(x, rel=1e-3) == 1.0
-    assert pytest.approx(y, rel=1e-3) == 1.0
-
-
-def test_compute_position_ignores_old_scanners(bermuda_device):
-    """Positions should ignore data older than max_age."""
-    bermuda_device.options[CONF_SCANNER_COORDS] = {
-        "s1": [0.0, 0.0],
-        "s2": [2.0, 0.0],
-        "s3": [0.0, 2.0],
-    }
-    now = monotonic_time_coarse()
-    bermuda_device.scanner_distance = {"s1": 1.0, "s2": 1.0, "s3": 1.0}
-    bermuda_device.scanner_last_update = {"s1": now - 5.0, "s2": now - 5.0, "s3": now}
-
-    pos = bermuda_device.compute_position(bermuda_device.options[CONF_SCANNER_COORDS])
-    assert pos is None
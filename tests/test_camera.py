@@ -0,0 +1,190 @@
+"""
+Tests for the floor plan drawing helpers in camera.py.
+"""
+
+import io
+
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from PIL import Image
+
+from custom_components.bermuda.camera import (
+    PATH_CHECK_TTL,
+    BermudaFloorPlanCamera,
+    _coords_to_points,
+    _make_sprite,
+    _scale_points,
+    _stamp,
+)
+from custom_components.bermuda.const import (
+    CONF_DEVICE_COORDS,
+    CONF_ENABLE_TRIANGULATION,
+    CONF_FLOORPLAN_IMAGE,
+    CONF_SCANNER_COORDS,
+)
+
+NO_POINTS = np.empty((0, 2), dtype=np.int32)
+# A red device marker blended over the white floor plan.
+DEVICE_PIXEL = [255, 63, 63, 255]
+
+
+@pytest.fixture
+def floorplan(tmp_path):
+    """A plain white 100x50 floor plan image."""
+    path = tmp_path / "floorplan.png"
+    Image.new("RGB", (100, 50), "white").save(path)
+    return path
+
+
+@pytest.fixture
+def camera(floorplan):
+    """Floor plan camera with a scanner at (10, 10) and a pinned device at (40, 20)."""
+    entry = MagicMock()
+    entry.entry_id = "test"
+    entry.options = {
+        CONF_FLOORPLAN_IMAGE: str(floorplan),
+        CONF_ENABLE_TRIANGULATION: True,
+        CONF_SCANNER_COORDS: {"aa:bb:cc:dd:ee:01": [10, 10]},
+        CONF_DEVICE_COORDS: {"AA:BB:CC:DD:EE:02": [40, 20]},
+    }
+    coordinator = MagicMock()
+    coordinator.tri_xy = np.full((1, 2), np.nan, dtype=np.float32)
+    # Run "executor" jobs inline, but keep count of them.
+    coordinator.hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    return BermudaFloorPlanCamera(coordinator, entry)
+
+
+def decode(png: bytes) -> np.ndarray:
+    """Decode PNG bytes into an (H, W, 4) array."""
+    with Image.open(io.BytesIO(png)) as img:
+        return np.array(img.convert("RGBA"))
+
+
+def test_coords_to_points_skips_malformed():
+    """Only [x, y] style entries should become (rounded) pixel points."""
+    pts = _coords_to_points([[1, 2], (3.4, 4.6), "nope", [7], ("a", 1), [None, 2], [5, 6, 99]])
+    assert pts.shape == (3, 2)
+    assert pts.tolist() == [[1, 2], [3, 5], [5, 6]]
+
+
+def test_coords_to_points_empty():
+    """No coordinates still gives a usable (0, 2) array."""
+    assert _coords_to_points([]).shape == (0, 2)
+
+
+def test_scale_points():
+    """Points follow the floor plan when it is shrunk, and are passed through untouched otherwise."""
+    pts = np.array([[10, 20], [3, 5]], dtype=np.int32)
+    assert _scale_points(pts, np.ones(2)) is pts
+    scaled = _scale_points(pts, np.array((0.5, 0.25)))
+    assert scaled.dtype == np.int32
+    assert scaled.tolist() == [[5, 5], [2, 1]]
+
+
+def test_stamp_paints_and_clamps():
+    """Markers are painted around each point, and points off the image are pinned inside its edge."""
+    arr = np.zeros((10, 10, 4), dtype=np.uint8)
+    _stamp(arr, np.array([[5, 5], [0, 0], [50, 50]], dtype=np.int32), _make_sprite(1, (255, 0, 0, 192)))
+    painted = arr[..., 3] == 192  # 192 alpha "over" a transparent pixel
+    assert painted[4:7, 4:7].all()
+    assert painted[0:3, 0:3].all()
+    assert painted[7:10, 7:10].all()
+    assert painted.sum() == 3 * 9
+
+
+def test_stamp_disc_sprite():
+    """Round sprites leave the corners of their square untouched."""
+    arr = np.zeros((9, 9, 4), dtype=np.uint8)
+    _stamp(arr, np.array([[4, 4]], dtype=np.int32), _make_sprite(4, (0, 0, 255, 192), disc=True))
+    assert arr[4, 4].tolist() == [0, 0, 192, 192]
+    assert arr[4, 0].tolist() == [0, 0, 192, 192]
+    assert arr[0, 0].tolist() == [0, 0, 0, 0]
+
+
+def test_stamp_blends_over_floor_plan():
+    """Semi-transparent markers are blended with what's underneath."""
+    arr = np.full((5, 5, 4), 255, dtype=np.uint8)
+    _stamp(arr, np.array([[2, 2]], dtype=np.int32), _make_sprite(1, (255, 0, 0, 192)))
+    # 255 * 63 / 255 of the white stays in green/blue, alpha remains opaque.
+    assert arr[2, 2].tolist() == [255, 63, 63, 255]
+    assert arr[0, 0].tolist() == [255, 255, 255, 255]
+
+
+def test_stamp_overlapping_points():
+    """Overlapping markers are painted once each, not blended into one another."""
+    arr = np.zeros((10, 10, 4), dtype=np.uint8)
+    _stamp(arr, np.array([[4, 4], [5, 4], [5, 4]], dtype=np.int32), _make_sprite(1, (255, 0, 0, 192)))
+    assert (arr[3:6, 3:7, 3] == 192).all()
+    assert (arr[..., 3] > 0).sum() == 3 * 4
+
+
+def test_stamp_overlapping_discs_ignore_order():
+    """Where one disc overlaps the unpainted corner of another's square, the disc still shows."""
+    sprite = _make_sprite(4, (0, 0, 255, 192), disc=True)
+    points = np.array([[4, 4], [10, 4]], dtype=np.int32)
+    forward = np.zeros((9, 15, 4), dtype=np.uint8)
+    _stamp(forward, points, sprite)
+    backward = np.zeros((9, 15, 4), dtype=np.uint8)
+    _stamp(backward, points[::-1], sprite)
+    assert (forward == backward).all()
+    assert forward[1, 6].tolist() == [0, 0, 192, 192]  # only inside the left disc
+    assert forward[1, 8].tolist() == [0, 0, 192, 192]  # only inside the right disc
+    assert forward[4, 7].tolist() == [0, 0, 192, 192]  # inside both
+
+
+def test_render_sizes_keep_their_own_layers(camera, floorplan):
+    """Each requested size gets its own scaled layer, with the markers moved to match."""
+    stat = floorplan.stat()
+    small = decode(camera._render_blocking(floorplan, stat, NO_POINTS, 50, None))
+    full = decode(camera._render_blocking(floorplan, stat, NO_POINTS, None, None))
+    assert small.shape == (25, 50, 4)
+    assert full.shape == (50, 100, 4)
+    assert small[10, 20].tolist() == DEVICE_PIXEL
+    assert full[20, 40].tolist() == DEVICE_PIXEL
+
+    layer = camera._static_layers[(50, None)]
+    camera._render_blocking(floorplan, stat, NO_POINTS, 50, None)
+    assert camera._static_layers[(50, None)] is layer
+    assert set(camera._static_layers) == {(50, None), (None, None)}
+
+
+def test_replaced_floorplan_is_decoded_afresh(camera, floorplan):
+    """A changed image file replaces the held decode and drops layers made from the old one."""
+    camera._render_blocking(floorplan, floorplan.stat(), NO_POINTS, 50, None)
+    Image.new("RGB", (80, 40), "white").save(floorplan)
+    stat = floorplan.stat()
+    assert decode(camera._render_blocking(floorplan, stat, NO_POINTS, None, None)).shape == (40, 80, 4)
+    file_key = (str(floorplan), stat.st_mtime_ns, stat.st_size)
+    assert camera._base[0] == file_key
+    assert list(camera._static_layers) == [(None, None)]
+
+
+async def test_camera_image_reuses_unchanged_frame(camera):
+    """Unchanged inputs are answered from the last PNG, without any executor job."""
+    executor = camera.coordinator.hass.async_add_executor_job
+    with patch("custom_components.bermuda.camera.monotonic_time_coarse", return_value=1000.0):
+        png = await camera.async_camera_image(width=50)
+        assert decode(png).shape == (25, 50, 4)
+        jobs = executor.await_count
+        assert await camera.async_camera_image(width=50) is png
+        assert executor.await_count == jobs
+
+        # A new triangulated position needs a new frame, but not a new stat().
+        camera.coordinator.tri_xy = np.array([[60.0, 30.0]], dtype=np.float32)
+        moved = decode(await camera.async_camera_image(width=50))
+        assert executor.await_count == jobs + 1
+        assert moved[15, 30].tolist() != decode(png)[15, 30].tolist()
+
+
+async def test_camera_image_missing_file_stat_is_reused(camera, tmp_path):
+    """A missing floor plan is only looked for again once PATH_CHECK_TTL has passed."""
+    camera.entry.options[CONF_FLOORPLAN_IMAGE] = str(tmp_path / "missing.png")
+    executor = camera.coordinator.hass.async_add_executor_job
+    with patch("custom_components.bermuda.camera.monotonic_time_coarse", return_value=1000.0):
+        assert await camera.async_camera_image() is None
+        assert await camera.async_camera_image() is None
+    assert executor.await_count == 1
+    with patch("custom_components.bermuda.camera.monotonic_time_coarse", return_value=1000.0 + PATH_CHECK_TTL):
+        assert await camera.async_camera_image() is None
+    assert executor.await_count == 2
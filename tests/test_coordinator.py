@@ -0,0 +1,86 @@
+"""
+Tests for the batched position solve in coordinator.py.
+"""
+
+import copy
+import logging
+import numpy as np
+import pytest
+from bluetooth_data_tools import monotonic_time_coarse
+from custom_components.bermuda.bermuda_device import BermudaDevice
+from custom_components.bermuda.coordinator import BermudaDataUpdateCoordinator
+from custom_components.bermuda.const import CONF_SCANNER_COORDS
+
+SCANNER_COORDS = {
+    "s1": [0.0, 0.0],
+    "s2": [2.0, 0.0],
+    "s3": [0.0, 2.0],
+    "s4": [2.0, 2.0],
+}
+
+
+@pytest.fixture
+def scanner_coordinator(mock_coordinator):
+    """Mocked coordinator with four floor plan scanners."""
+    mock_coordinator.options[CONF_SCANNER_COORDS] = copy.deepcopy(SCANNER_COORDS)
+    mock_coordinator.load_scanner_coords()
+    return mock_coordinator
+
+
+def test_load_scanner_coords_skips_malformed(mock_coordinator):
+    """Scanners with unusable coordinates are left out of the index and points."""
+    mock_coordinator.options[CONF_SCANNER_COORDS] = {"s1": [0, 1], "s2": [None, 4.0], "s3": "bad", "s4": ["2", 3]}
+    mock_coordinator.load_scanner_coords()
+    assert mock_coordinator.scanner_index == {"s1": 0, "s4": 1}
+    assert mock_coordinator._scanner_points.tolist() == [[0.0, 1.0], [2.0, 3.0]]
+
+
+def add_device(coordinator, address: str, readings: dict[str, tuple[float, float]]) -> BermudaDevice:
+    """Add a device to the coordinator with {scanner: (distance, age in seconds)} readings."""
+    device = BermudaDevice(address=address, coordinator=coordinator)
+    now = monotonic_time_coarse()
+    for scanner, (distance, age) in readings.items():
+        idx = coordinator.scanner_index[scanner]
+        device.scanner_distance_arr[idx] = distance
+        device.scanner_last_update_arr[idx] = now - age
+    coordinator.devices[device.address] = device
+    return device
+
+
+def test_calculate_positions(scanner_coordinator):
+    """Devices heard by three or more scanners get a position, on the device and in tri_xy."""
+    d = 2**0.5
+    three = add_device(scanner_coordinator, "AA:BB:CC:DD:EE:01", {s: (d, 0.0) for s in ("s1", "s2", "s3")})
+    four = add_device(scanner_coordinator, "AA:BB:CC:DD:EE:02", {s: (d, 0.0) for s in SCANNER_COORDS})
+    BermudaDataUpdateCoordinator._calculate_positions(scanner_coordinator)
+    for device in (three, four):
+        assert device.position == pytest.approx((1.0, 1.0), rel=1e-3)
+        assert (device.coord_x, device.coord_y) == device.position
+    assert scanner_coordinator.tri_xy.shape == (2, 2)
+    assert np.allclose(scanner_coordinator.tri_xy, 1.0, rtol=1e-3)
+
+
+def test_calculate_positions_ignores_old_readings(scanner_coordinator):
+    """Stale (and never updated) readings don't count, and clear any previous position."""
+    device = add_device(
+        scanner_coordinator, "AA:BB:CC:DD:EE:03", {"s1": (1.0, 5.0), "s2": (1.0, 5.0), "s3": (1.0, 0.0)}
+    )
+    device.set_position((1.0, 1.0))
+    BermudaDataUpdateCoordinator._calculate_positions(scanner_coordinator)
+    assert device.position is None
+    assert device.coord_x is None
+    assert np.isnan(scanner_coordinator.tri_xy).all()
+
+
+def test_calculate_positions_insufficient_scanners_warns(scanner_coordinator, caplog):
+    """A warning is logged when fewer than three scanners can place a tracked device."""
+    tracked = add_device(scanner_coordinator, "AA:BB:CC:DD:EE:04", {"s1": (1.0, 0.0), "s2": (1.0, 0.0)})
+    tracked.create_sensor = True
+    untracked = add_device(scanner_coordinator, "AA:BB:CC:DD:EE:05", {"s1": (1.0, 0.0), "s2": (1.0, 0.0)})
+    with caplog.at_level(logging.WARNING):
+        BermudaDataUpdateCoordinator._calculate_positions(scanner_coordinator)
+    assert tracked.position is None
+    assert untracked.position is None
+    warnings = [r.message for r in caplog.records if "Triangulation requires at least 3 scanners" in r.message]
+    assert len(warnings) == 1
+    assert tracked.address in warnings[0]
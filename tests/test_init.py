@@ -7,7 +7,7 @@ from homeassistant.core import HomeAssistant
 # from homeassistant.exceptions import ConfigEntryNotReady
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.bermuda.const import DOMAIN, IrkTypes
+from custom_components.bermuda.const import CONF_SCANNER_COORDS, DOMAIN, NAME, IrkTypes
 from custom_components.bermuda.coordinator import BermudaDataUpdateCoordinator
 
 from .const import MOCK_CONFIG
@@ -41,6 +41,30 @@ async def test_setup_unload_and_reload_entry(
     assert setup_bermuda_entry.state == ConfigEntryState.NOT_LOADED
 
 
+async def test_setup_entry_scanner_coords(hass: HomeAssistant, bypass_get_data):
+    """Scanner coordinates from the options reach the coordinator, and malformed ones are skipped."""
+    coords = {
+        "aa:bb:cc:dd:ee:01": [1.0, 2.0],
+        "aa:bb:cc:dd:ee:02": [3.0, 4.0],
+        "aa:bb:cc:dd:ee:03": "bad",
+        "aa:bb:cc:dd:ee:04": [None, 4.0],
+        "aa:bb:cc:dd:ee:05": ["x", 1],
+    }
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG, options={CONF_SCANNER_COORDS: coords}, entry_id="test", title=NAME
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert config_entry.state == ConfigEntryState.LOADED
+
+    coordinator: BermudaDataUpdateCoordinator = config_entry.runtime_data.coordinator
+    assert coordinator.options[CONF_SCANNER_COORDS] == coords
+    assert coordinator.scanner_index == {"aa:bb:cc:dd:ee:01": 0, "aa:bb:cc:dd:ee:02": 1}
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
 async def test_setup_entry_exception(hass, error_on_get_data):
     """Test ConfigEntryNotReady when API raises an exception during entry setup."""
     config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id="test")
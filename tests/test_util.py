@@ -6,6 +6,8 @@ from __future__ import annotations
 
 from math import floor
 
+import numpy as np
+
 from custom_components.bermuda import util
 
 
@@ -45,3 +47,32 @@ def test_rssi_to_metres():
 def test_clean_charbuf():
     assert util.clean_charbuf("a Normal string.") == "a Normal string."
     assert util.clean_charbuf("Broken\000String\000Fixed\000\000\000") == "Broken"
+
+
+def test_coords_xy():
+    assert util.coords_xy([1, 2.5]) == (1.0, 2.5)
+    assert util.coords_xy(("3", 4, 99)) == (3.0, 4.0)
+    assert util.coords_xy([None, 4.0]) is None
+    assert util.coords_xy(["x", 1]) is None
+    assert util.coords_xy([float("nan"), 1]) is None
+    assert util.coords_xy([1]) is None
+    assert util.coords_xy("12") is None
+
+
+def test_trilaterate_batch():
+    nan = float("nan")
+    points = np.array([[0.0, 0.0], [2.0, 0.0], [0.0, 2.0], [2.0, 2.0], [1.0, 0.0]])
+    d = 2**0.5
+    dists = np.array(
+        [
+            [d, d, d, nan, nan],  # exactly three scanners
+            [d, d, d, d, nan],  # more than three
+            [nan, d, d, d, nan],  # three, with the first missing
+            [1.0, nan, nan, 1.0, nan],  # too few
+            [1.0, 1.0, nan, nan, 1.0],  # collinear scanners can't give a fix
+        ]
+    )
+    out = util.trilaterate_batch(points, dists)
+    assert out.shape == (5, 2)
+    assert np.allclose(out[:3], 1.0)
+    assert np.isnan(out[3:]).all()